@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+"""
+Q6.10 ALU Golden Model (vectorized)
+Bit-exact NumPy model of 01_RTL/alu.v: verifies INSTn_O.dat against INSTn_I.dat
+and generates golden data for large random pattern sets
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+PATTERN_DIR = '00_TESTBED/pattern'
+RANDOM_DIR = '00_TESTBED/pattern_random'
+
+INST_W = 4
+DATA_W = 16
+IN_W = INST_W + 2 * DATA_W   # 36-bit input line: {inst, data_a, data_b}
+
+MAX_VALUE = 0x7FFF
+MIN_VALUE = -0x8000
+
+ACC_W = 36
+ACC_MAX_VALUE = (1 << (ACC_W - 1)) - 1
+ACC_MIN_VALUE = -(1 << (ACC_W - 1))
+
+COEFF_6 = 171    # 1/6 in Q6.10
+COEFF_120 = 9    # 1/120 in Q6.10
+
+INST_ADD = 0
+INST_SUB = 1
+INST_MAC = 2
+INST_SIN = 3
+INST_GRAY = 4
+INST_LRCW = 5
+INST_ROTATE = 6
+INST_CLZ = 7
+INST_MATCH4 = 8
+INST_TRANSPOSE = 9
+
+INST_NAMES = {
+    INST_ADD: 'ADD', INST_SUB: 'SUB', INST_MAC: 'MAC', INST_SIN: 'SIN',
+    INST_GRAY: 'GRAY', INST_LRCW: 'LRCW', INST_ROTATE: 'ROTATE',
+    INST_CLZ: 'CLZ', INST_MATCH4: 'MATCH4', INST_TRANSPOSE: 'TRANSPOSE',
+}
+
+
+# ========================================
+# Pattern I/O
+# ========================================
+
+def read_bin_pattern(path, width):
+    """Read a $readmemb file of fixed-width binary lines into a uint64 array"""
+    with open(path, 'rb') as f:
+        raw = f.read().replace(b'\r', b'')
+    if not raw.endswith(b'\n'):
+        raw += b'\n'
+
+    chars = np.frombuffer(raw, dtype=np.uint8)
+    if chars.size % (width + 1) == 0:
+        rows = chars.reshape(-1, width + 1)
+        if np.all(rows[:, width] == ord('\n')):
+            bits = (rows[:, :width] - ord('0')).astype(np.uint64)
+            weights = np.uint64(1) << np.arange(width - 1, -1, -1, dtype=np.uint64)
+            return bits @ weights
+
+    # Irregular file (blank lines, mixed widths): parse line by line
+    lines = [line.strip() for line in raw.decode().splitlines()]
+    return np.array([int(line, 2) for line in lines if line], dtype=np.uint64)
+
+
+def write_bin_pattern(path, values, width):
+    """Write an integer array as fixed-width binary lines"""
+    values = np.asarray(values, dtype=np.uint64)
+    shifts = np.arange(width - 1, -1, -1, dtype=np.uint64)
+    rows = np.empty((values.size, width + 1), dtype=np.uint8)
+    rows[:, :width] = ((values[:, None] >> shifts) & np.uint64(1)).astype(np.uint8) + ord('0')
+    rows[:, width] = ord('\n')
+    with open(path, 'wb') as f:
+        f.write(rows.tobytes())
+
+
+def split_inputs(lines):
+    """Split 36-bit input lines into (inst, data_a, data_b) arrays"""
+    lines = np.asarray(lines, dtype=np.uint64)
+    inst = (lines >> np.uint64(2 * DATA_W)).astype(np.int64) & 0xF
+    data_a = (lines >> np.uint64(DATA_W)).astype(np.int64) & 0xFFFF
+    data_b = lines.astype(np.int64) & 0xFFFF
+    return inst, data_a, data_b
+
+
+def pack_inputs(inst, data_a, data_b):
+    """Pack (inst, data_a, data_b) arrays into 36-bit input lines"""
+    inst = np.asarray(inst, dtype=np.uint64) & np.uint64(0xF)
+    data_a = np.asarray(data_a, dtype=np.uint64) & np.uint64(0xFFFF)
+    data_b = np.asarray(data_b, dtype=np.uint64) & np.uint64(0xFFFF)
+    return (inst << np.uint64(2 * DATA_W)) | (data_a << np.uint64(DATA_W)) | data_b
+
+
+# ========================================
+# Fixed-point helpers
+# ========================================
+
+def to_signed(values, bits):
+    """Interpret the low `bits` bits of an int64 array as two's complement"""
+    mask = (1 << bits) - 1
+    sign = 1 << (bits - 1)
+    values = values & mask
+    return values - ((values & sign) << 1)
+
+
+def saturate16(values):
+    """Saturate to the Q6.10 range and return the 16-bit output pattern"""
+    return np.clip(values, MIN_VALUE, MAX_VALUE) & 0xFFFF
+
+
+# ========================================
+# Instructions
+# ========================================
+
+def alu_add(data_a, data_b):
+    """4'b0000: saturating addition"""
+    return saturate16(to_signed(data_a, 16) + to_signed(data_b, 16))
+
+
+def alu_sub(data_a, data_b):
+    """4'b0001: saturating subtraction"""
+    return saturate16(to_signed(data_a, 16) - to_signed(data_b, 16))
+
+
+def mac_scan(products, acc=0):
+    """
+    Run the saturating 36-bit accumulator over a product stream.
+    Returns (acc_sum per step, final accumulator), where acc_sum is the
+    unsaturated 37-bit sum the RTL rounds for o_data
+    """
+    n = products.size
+    sums = np.empty(n, dtype=np.int64)
+    start = 0
+    window = 64
+    while start < n:
+        stop = min(n, start + window)
+        s = acc + np.cumsum(products[start:stop])
+        overflow = np.flatnonzero((s > ACC_MAX_VALUE) | (s < ACC_MIN_VALUE))
+        if overflow.size == 0:
+            sums[start:stop] = s
+            acc = int(s[-1])
+            start = stop
+            window *= 2
+        else:
+            idx = int(overflow[0])
+            sums[start:start + idx + 1] = s[:idx + 1]
+            acc = min(max(int(s[idx]), ACC_MIN_VALUE), ACC_MAX_VALUE)
+            start += idx + 1
+            window = 64
+    return sums, acc
+
+
+def alu_mac(data_a, data_b, acc=0):
+    """4'b0010: multiply-accumulate; returns (outputs, final accumulator)"""
+    products = to_signed(data_a, 16) * to_signed(data_b, 16)
+    sums, acc = mac_scan(products, acc)
+
+    # Round half up on acc_sum[9:0], keep acc_sum[35:10] as a 26-bit signed value
+    rounded = (sums >> 10) + ((sums & 0x3FF) >= 512)
+    return saturate16(to_signed(rounded, 26)), acc
+
+
+def sin_reference(a):
+    """4'b0011: scalar Taylor sin(x) ~ x - x^3/6 + x^5/120, bit-exact with alu.v"""
+    a = a - 0x10000 if a & 0x8000 else a
+    x_extended = a << 10
+    x_squared = a * a
+    x_cubed = a * x_squared
+    x_fifth = x_squared * x_cubed
+
+    # Unsigned coefficients make Verilog zero-extend the signed products
+    term2 = ((COEFF_6 * (x_cubed & ((1 << 48) - 1))) >> 20) & 0xFFFFFFFF
+    term3 = ((COEFF_120 * (x_fifth & ((1 << 80) - 1))) >> 40) & 0xFFFFFFFF
+    term2 -= (term2 & 0x80000000) << 1
+    term3 -= (term3 & 0x80000000) << 1
+
+    sin_high_prec = (x_extended - term2 + term3) & 0xFFFFFFFF
+    sin_high_prec -= (sin_high_prec & 0x80000000) << 1
+
+    rounded = (sin_high_prec >> 10) + ((sin_high_prec & 0x3FF) >= 512)
+    sin_result = rounded & 0x1FFFF
+    sin_result -= (sin_result & 0x10000) << 1
+    return min(max(sin_result, MIN_VALUE), MAX_VALUE) & 0xFFFF
+
+
+_SIN_TABLE = None
+
+
+def alu_sin(data_a):
+    """4'b0011: sin via a 64K-entry table of sin_reference"""
+    global _SIN_TABLE
+    if _SIN_TABLE is None:
+        _SIN_TABLE = np.array([sin_reference(a) for a in range(1 << 16)], dtype=np.int64)
+    return _SIN_TABLE[data_a]
+
+
+def alu_gray(data_a):
+    """4'b0100: binary to gray code"""
+    return (data_a >> 1) ^ data_a
+
+
+def popcount16(values):
+    """Population count of 16-bit values"""
+    values = values - ((values >> 1) & 0x5555)
+    values = (values & 0x3333) + ((values >> 2) & 0x3333)
+    values = (values + (values >> 4)) & 0x0F0F
+    return (values + (values >> 8)) & 0x1F
+
+
+def alu_lrcw(data_a, data_b):
+    """4'b0101: shift data_b left CPOP(data_a) times, feeding back the inverted MSB"""
+    cpop = popcount16(data_a)
+    inverted = ~data_b & 0xFFFF
+    return ((data_b << cpop) | (inverted >> (16 - cpop))) & 0xFFFF
+
+
+def alu_rotate(data_a, data_b):
+    """4'b0110: right rotate via ({a, a} >> b)[15:0]"""
+    doubled = (data_a << 16) | data_a
+    return np.where(data_b < 32, (doubled >> np.minimum(data_b, 31)) & 0xFFFF, 0)
+
+
+def alu_clz(data_a):
+    """4'b0111: count leading zeros"""
+    count = np.full(data_a.shape, 16, dtype=np.int64)
+    for bit in range(16):
+        count = np.where(data_a >> bit, 15 - bit, count)
+    return count
+
+
+def alu_match4(data_a, data_b):
+    """4'b1000: reverse match4, bit i = (a[i+3:i] == b[15-i:12-i])"""
+    result = np.zeros(data_a.shape, dtype=np.int64)
+    for i in range(13):
+        match = ((data_a >> i) & 0xF) == ((data_b >> (12 - i)) & 0xF)
+        result |= match.astype(np.int64) << i
+    return result
+
+
+def alu_transpose(data_a):
+    """4'b1001: transpose 8x8 matrices of 2-bit elements, 8 columns in -> 8 rows out"""
+    columns = data_a.reshape(-1, 8)
+    # element[m, row, col] = column col of matrix m, bits [15-2*row:14-2*row]
+    shifts = np.arange(14, -1, -2)
+    elements = (columns[:, None, :] >> shifts[None, :, None]) & 0x3
+    rows = (elements << shifts[None, None, :]).sum(axis=2)
+    return rows.reshape(-1)
+
+
+# ========================================
+# Stream simulation
+# ========================================
+
+def matrix_group_starts(inst):
+    """
+    Indices where a transpose starts; each consumes the next 8 inputs.
+    The last group may be truncated by the end of the stream
+    """
+    idx9 = np.flatnonzero(inst == INST_TRANSPOSE)
+    if idx9.size == inst.size:
+        return np.arange(0, inst.size, 8)
+
+    starts = []
+    busy_until = 0
+    for i in idx9.tolist():
+        if i >= busy_until:
+            starts.append(i)
+            busy_until = i + 8
+    return np.array(starts, dtype=np.int64)
+
+
+def simulate(inst, data_a, data_b, acc=0):
+    """
+    Run a stream of accepted inputs through the ALU.
+    Returns (o_data array in output order, final accumulator)
+    """
+    n = inst.size
+    starts = matrix_group_starts(inst)
+    in_matrix = np.zeros(n + 8, dtype=np.int64)
+    np.add.at(in_matrix, starts, 1)
+    np.add.at(in_matrix, starts + 8, -1)
+    in_matrix = np.cumsum(in_matrix[:n]) > 0
+
+    # A group cut off by the end of the stream stays in MATRIX_INPUT: its inputs
+    # are absorbed as columns and it never reaches MATRIX_OUTPUT
+    starts = starts[starts + 8 <= n]
+
+    # Outputs per input: 1 for scalar ops, 8 on a transpose start, 0 for matrix columns
+    counts = np.where(in_matrix, 0, 1)
+    counts[starts] = 8
+    offsets = np.cumsum(counts) - counts
+    out = np.zeros(int(counts.sum()), dtype=np.int64)
+
+    scalar_ops = {
+        INST_ADD: lambda a, b: alu_add(a, b),
+        INST_SUB: lambda a, b: alu_sub(a, b),
+        INST_SIN: lambda a, b: alu_sin(a),
+        INST_GRAY: lambda a, b: alu_gray(a),
+        INST_LRCW: alu_lrcw,
+        INST_ROTATE: alu_rotate,
+        INST_CLZ: lambda a, b: alu_clz(a),
+        INST_MATCH4: alu_match4,
+    }
+    for code, op in scalar_ops.items():
+        sel = np.flatnonzero((inst == code) & ~in_matrix)
+        if sel.size:
+            out[offsets[sel]] = op(data_a[sel], data_b[sel])
+
+    sel = np.flatnonzero((inst == INST_MAC) & ~in_matrix)
+    if sel.size:
+        out[offsets[sel]], acc = alu_mac(data_a[sel], data_b[sel], acc)
+
+    # Undefined instruction codes leave the zero default
+
+    if starts.size:
+        columns = data_a[(starts[:, None] + np.arange(8)).reshape(-1)]
+        rows = alu_transpose(columns).reshape(-1, 8)
+        out[(offsets[starts][:, None] + np.arange(8)).reshape(-1)] = rows.reshape(-1)
+
+    return out, acc
+
+
+def simulate_lines(lines):
+    """Run 36-bit input lines through the ALU and return 16-bit output lines"""
+    return simulate(*split_inputs(lines))[0]
+
+
+# ========================================
+# Verification / generation
+# ========================================
+
+def verify_patterns(pattern_dir=PATTERN_DIR, insts=range(10)):
+    """Verify INSTn_O.dat against the model for every instruction"""
+    print("="*80)
+    print("VERIFYING ALU PATTERNS")
+    print("="*80)
+
+    all_passed = True
+    for n in insts:
+        in_path = os.path.join(pattern_dir, f'INST{n}_I.dat')
+        out_path = os.path.join(pattern_dir, f'INST{n}_O.dat')
+        if not os.path.exists(in_path) or not os.path.exists(out_path):
+            print(f"INST{n} {INST_NAMES[n]:9s}: missing pattern files, skipped")
+            continue
+
+        got = simulate_lines(read_bin_pattern(in_path, IN_W))
+        expected = read_bin_pattern(out_path, DATA_W).astype(np.int64)
+
+        if got.size < expected.size:
+            all_passed = False
+            print(f"INST{n} {INST_NAMES[n]:9s}: FAIL (model produced {got.size} outputs, expected {expected.size})")
+            continue
+
+        mismatches = np.flatnonzero(got[:expected.size] != expected)
+        if mismatches.size:
+            all_passed = False
+            print(f"INST{n} {INST_NAMES[n]:9s}: FAIL ({mismatches.size}/{expected.size} mismatches)")
+            for i in mismatches[:10]:
+                print(f"  Line {i+1}: Expected {int(expected[i]):016b}, Got {int(got[i]):016b}")
+        else:
+            print(f"INST{n} {INST_NAMES[n]:9s}: PASS ({expected.size} outputs)")
+
+    if all_passed:
+        print("\n*** ALL TESTS PASSED ***")
+        print("ALU model matches the golden patterns!")
+    else:
+        print("\n*** VERIFICATION FAILED ***")
+    return all_passed
+
+
+def generate_golden(pattern_dir=PATTERN_DIR, insts=range(10)):
+    """Regenerate INSTn_O.dat from INSTn_I.dat"""
+    print("\n" + "="*80)
+    print("GENERATING ALU GOLDEN DATA")
+    print("="*80)
+
+    for n in insts:
+        in_path = os.path.join(pattern_dir, f'INST{n}_I.dat')
+        out_path = os.path.join(pattern_dir, f'INST{n}_O.dat')
+        outputs = simulate_lines(read_bin_pattern(in_path, IN_W))
+        write_bin_pattern(out_path, outputs, DATA_W)
+        print(f"  - {out_path} ({outputs.size} outputs)")
+
+    print("\n*** GOLDEN DATA GENERATION COMPLETE ***")
+
+
+def random_inputs(rng, inst_code, count):
+    """Random (inst, data_a, data_b) lines for one instruction"""
+    if inst_code == INST_TRANSPOSE:
+        count -= count % 8
+    data_a = rng.integers(0, 1 << 16, count, dtype=np.int64)
+    data_b = rng.integers(0, 1 << 16, count, dtype=np.int64)
+    if inst_code == INST_SIN:
+        # Taylor expansion is only specified for |x| <= 0.5
+        data_a = rng.integers(-512, 512, count, dtype=np.int64) & 0xFFFF
+        data_b[:] = 0
+    elif inst_code == INST_ROTATE:
+        data_b = rng.integers(0, 17, count, dtype=np.int64)
+    elif inst_code in (INST_GRAY, INST_CLZ, INST_TRANSPOSE):
+        data_b[:] = 0
+    return pack_inputs(np.full(count, inst_code), data_a, data_b)
+
+
+def generate_random(count, out_dir=RANDOM_DIR, seed=None, insts=range(10)):
+    """Write random INSTn_I.dat and golden INSTn_O.dat with `count` vectors each"""
+    print("\n" + "="*80)
+    print(f"GENERATING {count} RANDOM VECTORS PER INSTRUCTION")
+    print("="*80)
+
+    os.makedirs(out_dir, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    total = 0
+    compute_time = 0.0
+
+    for n in insts:
+        lines = random_inputs(rng, n, count)
+        start = time.time()
+        outputs = simulate_lines(lines)
+        compute_time += time.time() - start
+        total += lines.size
+
+        write_bin_pattern(os.path.join(out_dir, f'INST{n}_I.dat'), lines, IN_W)
+        write_bin_pattern(os.path.join(out_dir, f'INST{n}_O.dat'), outputs, DATA_W)
+        print(f"INST{n} {INST_NAMES[n]:9s}: {lines.size} inputs, {outputs.size} outputs")
+
+    rate = total / compute_time if compute_time > 0 else 0.0
+    print(f"\nModel throughput: {rate:,.0f} vectors/sec")
+    print(f"Output directory: {out_dir}")
+    print("Note: set SEQ_LEN/PAT_LEN and VALID.dat in testbench.v to match")
+
+
+def main():
+    random_count = None
+    seed = None
+    out_dir = RANDOM_DIR
+
+    for arg in sys.argv[1:]:
+        try:
+            if arg.startswith('--random='):
+                random_count = int(arg.split('=')[1])
+            elif arg.startswith('--seed='):
+                seed = int(arg.split('=')[1])
+            elif arg.startswith('--out='):
+                out_dir = arg.split('=', 1)[1]
+        except ValueError:
+            print(f"Ignoring malformed option: {arg}")
+
+    print("Q6.10 ALU Golden Model")
+    print("="*80)
+
+    if random_count is not None:
+        generate_random(random_count, out_dir, seed)
+        verify_patterns(out_dir)
+    elif '--generate' in sys.argv:
+        generate_golden()
+    else:
+        verify_patterns()
+
+
+if __name__ == "__main__":
+    main()
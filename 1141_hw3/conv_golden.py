@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+3x3 Convolution Golden Model (vectorized)
+NumPy model of 01_RTL/core.v + conv_3x3.v: barcode decoding, zero-padded 3x3
+convolution for every stride/dilation, addressed outputs and pattern generation
+"""
+
+import glob
+import os
+import re
+import sys
+import time
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+PATTERN_DIR = '00_TESTBED/PATTERNS'
+RANDOM_DIR = '00_TESTBED/PATTERNS_RANDOM'
+
+IMG_SIZE = 64
+K_SIZE = 3
+STRIDES = (1, 2)
+DILATIONS = (1, 2)
+NUM_PORTS = 4          # o_out_data1..4
+NUM_BANKS = 8          # sram_512x8 instances, bank = addr[2:0]
+BANK_DEPTH = 512
+
+FRAC_BITS = 7          # weights are Q1.7
+ROUND_BIAS = 1 << (FRAC_BITS - 1)
+
+# Code 128-C symbols used by the barcode (11-bit patterns, stop is 13 bits)
+CODE128C = {
+    1: '11001101100',
+    2: '11001100110',
+    3: '10010011000',
+}
+START_C = '11010011100'
+STOP = '1100011101011'
+BARCODE_HEIGHT = 10
+SYMBOL_W = 11
+
+
+# ========================================
+# Pattern I/O
+# ========================================
+
+def read_hex_pattern(path):
+    """Read a $readmemh file with one byte per line"""
+    with open(path, 'r') as f:
+        lines = [line.strip() for line in f.readlines()]
+    return np.array([int(line, 16) for line in lines if line and not line.startswith('//')],
+                    dtype=np.int64)
+
+
+def write_hex_pattern(path, values):
+    """Write bytes as one two-digit hex value per line"""
+    values = np.asarray(values).reshape(-1) & 0xFF
+    with open(path, 'w') as f:
+        f.write('\n'.join(f'{v:02X}' for v in values.tolist()) + '\n')
+
+
+def config_tag(k, s, d):
+    """File name tag used by the shipped patterns, e.g. 030102 for K=3, S=1, D=2"""
+    return f'{k:02d}{s:02d}{d:02d}'
+
+
+# ========================================
+# Barcode
+# ========================================
+
+def embed_barcode(images, k, s, d, rows, cols):
+    """
+    Clear the LSB plane and draw a Code 128-C barcode (Start C, K, S, D, Stop)
+    with its top-left corner at (rows[n], cols[n]) of every image
+    """
+    bits = START_C + CODE128C[k] + CODE128C[s] + CODE128C[d] + STOP
+    bar = np.array([int(b) for b in bits], dtype=images.dtype)
+
+    images &= ~np.array(1, dtype=images.dtype)
+    for n in range(images.shape[0]):
+        r, c = int(rows[n]), int(cols[n])
+        images[n, r:r + BARCODE_HEIGHT, c:c + bar.size] |= bar
+    return images
+
+
+def barcode_width():
+    """Width in pixels of the embedded barcode"""
+    return 4 * SYMBOL_W + len(STOP)
+
+
+def decode_barcode(image):
+    """
+    Decode (K, S, D) the way core.v does while loading: slide an 11-bit window
+    over the raster-order LSB stream until Start C, then read 11-bit symbols
+    until one is invalid, after which the Start C search resumes one bit later.
+    The window ending on pixel e is checked in cycle e + 1 and registered after
+    it, and LOAD_IMG reports the registered values at pixel 4095, so a symbol
+    ending on either of the last two pixels never counts.
+    Returns (0, 0, 0) for an invalid configuration
+    """
+    lsb = ''.join('1' if p & 1 else '0' for p in np.asarray(image).reshape(-1).tolist())
+    symbols = {pattern: value for value, pattern in CODE128C.items()}
+    values = [0, 0, 0]
+    symbol_idx = 0
+
+    stream = lsb
+    pos = 0
+    while True:
+        start = stream.find(START_C, pos)
+        if start < 0:
+            break
+        symbol_idx = 0
+        pos = start + SYMBOL_W
+        while pos + SYMBOL_W < len(stream) - 1:
+            value = symbols.get(stream[pos:pos + SYMBOL_W])
+            if value is None:
+                break
+            if symbol_idx < 3:
+                values[symbol_idx] = value
+            symbol_idx = (symbol_idx + 1) & 0x3
+            pos += SYMBOL_W
+        # On an invalid symbol barcode_found clears and the window slides on by one bit
+        pos += 1
+
+    k, s, d = values
+    if k == K_SIZE and s in STRIDES and d in DILATIONS:
+        return k, s, d
+    return 0, 0, 0
+
+
+def lsb_stream_image(bits, offset):
+    """Image whose raster-order LSB stream is `bits` starting at pixel `offset`, zero elsewhere"""
+    image = np.zeros(IMG_SIZE * IMG_SIZE, dtype=np.int64)
+    image[offset:offset + len(bits)] = [int(b) for b in bits]
+    return image.reshape(IMG_SIZE, IMG_SIZE)
+
+
+# Streams the random sweep cannot produce: (description, bits, offset, core.v result)
+_KSD_322 = START_C + CODE128C[3] + CODE128C[2] + CODE128C[2]
+BARCODE_REGRESSIONS = [
+    ('D ends on pixel 4094', _KSD_322, IMG_SIZE * IMG_SIZE - 1 - len(_KSD_322), (0, 0, 0)),
+    ('D ends on pixel 4093', _KSD_322, IMG_SIZE * IMG_SIZE - 2 - len(_KSD_322), (3, 2, 2)),
+    ('Start C in a data slot',
+     START_C + CODE128C[3] + START_C + CODE128C[3] + CODE128C[1] + CODE128C[2], 100, (0, 0, 0)),
+]
+
+
+# ========================================
+# Convolution
+# ========================================
+
+def conv3x3(images, weights, stride, dilation):
+    """
+    Zero-padded 3x3 convolution of a batch of 64x64 images.
+    images: [N, 64, 64] unsigned pixels, weights: [N, 3, 3] or [3, 3] signed Q1.7.
+    Returns [N, 64 / stride, 64 / stride] outputs rounded half up and clamped to [0, 255]
+    """
+    images = np.asarray(images)
+    if images.ndim == 2:
+        images = images[None]
+    weights = np.asarray(weights, dtype=np.int64).reshape(-1, K_SIZE, K_SIZE)
+    weights = np.broadcast_to(weights, (images.shape[0], K_SIZE, K_SIZE))
+
+    pad = ((K_SIZE - 1) * dilation) // 2
+    padded = np.pad(images.astype(np.int32), ((0, 0), (pad, pad), (pad, pad)))
+
+    span = (K_SIZE - 1) * dilation + 1
+    windows = sliding_window_view(padded, (span, span), axis=(1, 2))
+    windows = windows[:, ::stride, ::stride, ::dilation, ::dilation]
+
+    acc = np.einsum('nhwij,nij->nhw', windows, weights.astype(np.int32), dtype=np.int64)
+    return np.clip((acc + ROUND_BIAS) >> FRAC_BITS, 0, 255)
+
+
+def sram_bank_layout(images):
+    """[N, 64, 64] images -> [N, 8, 512] bank contents (bank = addr[2:0], row = addr[11:3])"""
+    flat = np.asarray(images).reshape(-1, BANK_DEPTH, NUM_BANKS)
+    return flat.transpose(0, 2, 1)
+
+
+def conv3x3_reference(banks, weights, stride, dilation):
+    """Per-pixel model of conv_3x3.v fed from the SRAM banks (slow, for cross-checking)"""
+    size = IMG_SIZE // stride
+    result = np.zeros((size, size), dtype=np.int64)
+    w = [int(x) for x in np.asarray(weights).reshape(-1)]
+    for out_r in range(size):
+        for out_c in range(size):
+            r, c = out_r * stride, out_c * stride
+            acc = 0
+            for tap in range(K_SIZE * K_SIZE):
+                pr = r + (tap // K_SIZE - 1) * dilation
+                pc = c + (tap % K_SIZE - 1) * dilation
+                if 0 <= pr < IMG_SIZE and 0 <= pc < IMG_SIZE:
+                    addr = pr * IMG_SIZE + pc
+                    acc += int(banks[addr & 0x7, addr >> 3]) * w[tap]
+            result[out_r, out_c] = min(max((acc + ROUND_BIAS) >> FRAC_BITS, 0), 255)
+    return result
+
+
+def addressed_outputs(result):
+    """
+    Flatten output maps ([size, size] or [N, size, size]) into the (port, addr, data)
+    streams core.v emits, in emission order: port n drives o_out_data{n+1}/o_out_addr{n+1}
+    """
+    result = np.asarray(result)
+    size = result.shape[-1]
+    rows, cols = np.divmod(np.arange(size * size), size)
+    return cols % NUM_PORTS, rows * size + cols, result.reshape(*result.shape[:-2], -1)
+
+
+def rtl_port_streams(full_map, stride):
+    """
+    (port, addr, data) streams in core.v's own scan order, taken from a stride-1
+    map ([64, 64] or [N, 64, 64]): out_row/out_col step by the stride over input
+    coordinates, port = out_col % 4 (stride 1) or (out_col >> 1) % 4 (stride 2),
+    addr = {out_row, out_col} or {out_row[5:1], out_col[5:1]}
+    """
+    full_map = np.asarray(full_map)
+    coords = np.arange(0, IMG_SIZE, stride)
+    out_row, out_col = (a.reshape(-1) for a in np.meshgrid(coords, coords, indexing='ij'))
+    if stride == 1:
+        ports = out_col % NUM_PORTS
+        addrs = (out_row << 6) | out_col
+    else:
+        ports = (out_col >> 1) % NUM_PORTS
+        addrs = ((out_row >> 1) << 5) | (out_col >> 1)
+    return ports, addrs, full_map[..., out_row, out_col]
+
+
+def replay_out_mem(ports, addrs, data):
+    """
+    Rebuild the testbench's out_mem from the per-port streams: every port writes
+    out_mem[o_out_addrN] = o_out_dataN. Returns (out_mem, errors), where errors
+    lists addresses written more or less than once
+    """
+    outputs = addrs.size
+    counts = np.bincount(addrs, minlength=outputs)
+    errors = [f"ADDR {addr} written {counts[addr]} times" for addr in np.flatnonzero(counts != 1)[:5]]
+    out_mem = np.zeros(data.shape[:-1] + (outputs,), dtype=data.dtype)
+    for port in range(NUM_PORTS):
+        sel = ports == port
+        out_mem[..., addrs[sel]] = data[..., sel]
+    return out_mem, errors
+
+
+# ========================================
+# Random cases / sweeps
+# ========================================
+
+def random_cases(rng, count, stride, dilation):
+    """Random images with an embedded barcode and random Q1.7 weights"""
+    images = rng.integers(0, 256, (count, IMG_SIZE, IMG_SIZE), dtype=np.int64)
+    rows = rng.integers(0, IMG_SIZE - BARCODE_HEIGHT + 1, count)
+    cols = rng.integers(0, IMG_SIZE - barcode_width() + 1, count)
+    embed_barcode(images, K_SIZE, stride, dilation, rows, cols)
+    weights = rng.integers(-128, 128, (count, K_SIZE, K_SIZE), dtype=np.int64)
+    return images, weights
+
+
+def sweep(num_images=1000, seed=None, num_reference=1):
+    """Check decode + vectorized convolution for every stride/dilation on random images"""
+    print("="*80)
+    print(f"CONVOLUTION SWEEP: {num_images} RANDOM IMAGES PER CONFIGURATION")
+    print("="*80)
+
+    rng = np.random.default_rng(seed)
+    all_passed = True
+    total = 0
+    compute_time = 0.0
+
+    for stride in STRIDES:
+        for dilation in DILATIONS:
+            images, weights = random_cases(rng, num_images, stride, dilation)
+
+            start = time.time()
+            results = conv3x3(images, weights, stride, dilation)
+            compute_time += time.time() - start
+            total += num_images
+
+            # Port/address streams from core.v's scan order over the stride-1 map
+            # must match the addressed outputs of the strided model
+            full = results if stride == 1 else conv3x3(images, weights, 1, dilation)
+            rtl_ports, rtl_addrs, rtl_data = rtl_port_streams(full, stride)
+            ports, addrs, data = addressed_outputs(results)
+            errors = []
+            if not (np.array_equal(rtl_ports, ports) and np.array_equal(rtl_addrs, addrs)):
+                errors.append("Port/address order differs from core.v")
+            out_mem, replay_errors = replay_out_mem(rtl_ports, rtl_addrs, rtl_data)
+            errors += replay_errors
+            for n in np.flatnonzero((out_mem != data).any(axis=1))[:5]:
+                errors.append(f"Image {n}: core.v port streams do not rebuild the output map")
+            for n in range(num_images):
+                decoded = decode_barcode(images[n])
+                if decoded != (K_SIZE, stride, dilation):
+                    errors.append(f"Image {n}: barcode decoded as {decoded}")
+            for n in range(min(num_reference, num_images)):
+                banks = sram_bank_layout(images[n])[0]
+                expected = conv3x3_reference(banks, weights[n], stride, dilation)
+                mismatches = np.argwhere(results[n] != expected)
+                for r, c in mismatches[:5]:
+                    errors.append(f"Image {n} ({r},{c}): Expected {expected[r, c]}, Got {results[n, r, c]}")
+
+            tag = config_tag(K_SIZE, stride, dilation)
+            if errors:
+                all_passed = False
+                print(f"K={K_SIZE} S={stride} D={dilation} [{tag}]: FAIL")
+                for error in errors[:10]:
+                    print(f"  {error}")
+            else:
+                print(f"K={K_SIZE} S={stride} D={dilation} [{tag}]: PASS "
+                      f"({num_images} images, {results.shape[1]}x{results.shape[2]} outputs)")
+
+    for name, bits, offset, expected in BARCODE_REGRESSIONS:
+        decoded = decode_barcode(lsb_stream_image(bits, offset))
+        if decoded != expected:
+            all_passed = False
+            print(f"Barcode, {name}: FAIL (decoded as {decoded}, core.v gives {expected})")
+        else:
+            print(f"Barcode, {name}: PASS {decoded}")
+
+    rate = total / compute_time if compute_time > 0 else 0.0
+    print(f"\nModel throughput: {rate:,.0f} images/sec")
+
+    if all_passed:
+        print("\n*** ALL TESTS PASSED ***")
+    else:
+        print("\n*** VERIFICATION FAILED ***")
+    return all_passed
+
+
+def write_random_patterns(count, out_dir=RANDOM_DIR, seed=None):
+    """Write img/weight/golden .dat files for `count` random cases per configuration"""
+    print("\n" + "="*80)
+    print(f"GENERATING {count} RANDOM PATTERNS PER CONFIGURATION")
+    print("="*80)
+
+    os.makedirs(out_dir, exist_ok=True)
+    rng = np.random.default_rng(seed)
+
+    for stride in STRIDES:
+        for dilation in DILATIONS:
+            images, weights = random_cases(rng, count, stride, dilation)
+            results = conv3x3(images, weights, stride, dilation)
+            tag = config_tag(K_SIZE, stride, dilation)
+            for n in range(count):
+                write_hex_pattern(os.path.join(out_dir, f'img{n}_{tag}.dat'), images[n])
+                write_hex_pattern(os.path.join(out_dir, f'weight_img{n}_{tag}.dat'), weights[n])
+                write_hex_pattern(os.path.join(out_dir, f'golden_img{n}_{tag}.dat'), results[n])
+            print(f"K={K_SIZE} S={stride} D={dilation}: {count} cases -> {out_dir}/*_{tag}.dat")
+
+    print("\n*** PATTERN GENERATION COMPLETE ***")
+    print("Note: point INFILE/WFILE/GOLDEN and OUTPUTSIZE in testbench.v at the new files")
+
+
+def verify_patterns(pattern_dir=PATTERN_DIR):
+    """Check every img*/weight*/golden* triple in a pattern directory"""
+    print("="*80)
+    print(f"VERIFYING PATTERNS IN {pattern_dir}")
+    print("="*80)
+
+    name_re = re.compile(r'^img(.*)_(\d\d)(\d\d)(\d\d)(.*)\.dat$')
+    paths = sorted(glob.glob(os.path.join(pattern_dir, 'img*.dat')))
+    if not paths:
+        print("No pattern files found")
+        return False
+
+    all_passed = True
+    for path in paths:
+        name = os.path.basename(path)
+        match = name_re.match(name)
+        if not match:
+            continue
+        expected_config = tuple(int(match.group(i)) for i in (2, 3, 4))
+        image = read_hex_pattern(path).reshape(IMG_SIZE, IMG_SIZE)
+        decoded = decode_barcode(image)
+        if decoded == (0, 0, 0):
+            # Invalid configuration: only the barcode stage is checked
+            print(f"{name}: barcode invalid, decoded {decoded}")
+            continue
+        if decoded != expected_config:
+            all_passed = False
+            print(f"{name}: FAIL (barcode decoded as {decoded}, file name says {expected_config})")
+            continue
+
+        _, stride, dilation = decoded
+        weights = read_hex_pattern(os.path.join(pattern_dir, 'weight_' + name))[:K_SIZE * K_SIZE]
+        weights = np.where(weights >= 128, weights - 256, weights)
+        golden = read_hex_pattern(os.path.join(pattern_dir, 'golden_' + name))
+
+        result, errors = replay_out_mem(*addressed_outputs(conv3x3(image, weights, stride, dilation)[0]))
+        mismatches = np.flatnonzero(result != golden[:result.size])
+        if errors:
+            all_passed = False
+            print(f"{name}: FAIL ({', '.join(errors)})")
+        elif mismatches.size:
+            all_passed = False
+            print(f"{name}: FAIL ({mismatches.size}/{result.size} mismatches)")
+            for addr in mismatches[:10]:
+                print(f"  [ADDR {addr}] Expected {golden[addr]:02X}, Got {result[addr]:02X}")
+        else:
+            print(f"{name}: PASS (K={decoded[0]} S={stride} D={dilation}, {result.size} outputs)")
+
+    if all_passed:
+        print("\n*** ALL TESTS PASSED ***")
+    else:
+        print("\n*** VERIFICATION FAILED ***")
+    return all_passed
+
+
+def main():
+    num_images = 1000
+    write_count = None
+    seed = None
+
+    for arg in sys.argv[1:]:
+        try:
+            if arg.startswith('--images='):
+                num_images = int(arg.split('=')[1])
+            elif arg.startswith('--write='):
+                write_count = int(arg.split('=')[1])
+            elif arg.startswith('--seed='):
+                seed = int(arg.split('=')[1])
+        except ValueError:
+            print(f"Ignoring malformed option: {arg}")
+
+    print("3x3 Convolution Golden Model")
+    print("="*80)
+
+    if '--verify' in sys.argv:
+        verify_patterns()
+    elif write_count is not None:
+        write_random_patterns(write_count, seed=seed)
+    else:
+        sweep(num_images, seed)
+
+
+if __name__ == "__main__":
+    main()
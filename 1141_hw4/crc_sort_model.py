@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+CRC/SORT Simulator
+Verifies crc_core/sort_core behaviour with pattern1_data (f3.dat, f4.dat)
+and generates golden data for pattern2_data
+"""
+
+from vector_set import VectorSet
+
+# CRC-3 polynomial as implemented in crc_core: x^3 term implicit, bits [2:0] = 101
+CRC_POLY = 0b101
+
+# Odd-even transposition passes used by sort_core (cycle_cnt 0..16)
+SORT_PASSES = 17
+
+
+def crc_update_byte(crc, data_byte):
+    """Shift one byte (MSB first) through the CRC-3 register"""
+    for idx in range(8):
+        bit = (data_byte >> (7 - idx)) & 1
+        if ((crc >> 2) & 1) ^ bit:
+            crc = ((crc << 1) & 0x7) ^ CRC_POLY
+        else:
+            crc = (crc << 1) & 0x7
+    return crc
+
+
+# CRC_TABLE[crc][byte] -> next CRC
+CRC_TABLE = [[crc_update_byte(crc, b) for b in range(256)] for crc in range(8)]
+
+
+def crc_gen(key, data):
+    """CRC-3 over the 128-bit word {key, data}, most significant byte first"""
+    crc = 0
+    for word in (key, data):
+        for shift in range(56, -8, -8):
+            crc = CRC_TABLE[crc][(word >> shift) & 0xFF]
+    return crc
+
+
+def sort_network(values, passes=SORT_PASSES):
+    """Descending odd-even transposition sort, one pass per cycle as in sort_core"""
+    values = list(values)
+    for cycle in range(passes):
+        for i in range(cycle % 2, len(values) - 1, 2):
+            if values[i] < values[i + 1]:
+                values[i], values[i + 1] = values[i + 1], values[i]
+    return values
+
+
+def sort_bytes(key, data):
+    """Sort the 16 bytes of {key, data} in descending order, largest in the MSB"""
+    word = ((key << 64) | data).to_bytes(16, 'big')
+    word = int.from_bytes(bytes(sorted(word, reverse=True)), 'big')
+    return word >> 64, word & 0xFFFFFFFFFFFFFFFF
+
+
+def crc_gen_set(vectors):
+    """f3 results for every vector: CRC in bits [2:0], everything else zero"""
+    results = VectorSet.empty(len(vectors))
+    for i, (key, data) in enumerate(vectors):
+        results.data[i] = crc_gen(key, data)
+    return results
+
+
+def sort_set(vectors):
+    """f4 results for every vector"""
+    results = VectorSet.empty(len(vectors))
+    for i, (key, data) in enumerate(vectors):
+        results.key[i], results.data[i] = sort_bytes(key, data)
+    return results
+
+
+def compare_sets(name, expected, got):
+    """Return error strings for every mismatching line"""
+    errors = []
+    for i in range(min(len(expected), len(got))):
+        if expected[i].line != got[i].line:
+            errors.append(f"Line {i+1} {name}: Expected {expected[i].line}, Got {got[i].line}")
+    if len(expected) != len(got):
+        errors.append(f"{name}: Expected {len(expected)} lines, Got {len(got)}")
+    return errors
+
+
+def verify_pattern1():
+    """Verify CRC and SORT models with pattern1_data"""
+    print("="*80)
+    print("VERIFYING CRC/SORT WITH PATTERN1_DATA")
+    print("="*80)
+
+    patterns = VectorSet.read('00_TESTBED/pattern1_data/pattern1.dat')
+    f3_expected = VectorSet.read('00_TESTBED/pattern1_data/f3.dat')
+    f4_expected = VectorSet.read('00_TESTBED/pattern1_data/f4.dat')
+
+    errors = compare_sets('f3.dat CRC', f3_expected, crc_gen_set(patterns))
+    errors += compare_sets('f4.dat SORT', f4_expected, sort_set(patterns))
+
+    # The sort network schedule itself must reach the fully sorted order
+    for i, (key, data) in enumerate(patterns):
+        word = ((key << 64) | data).to_bytes(16, 'big')
+        if sort_network(word[::-1]) != sorted(word, reverse=True):
+            errors.append(f"Line {i+1} sort network: {SORT_PASSES} passes do not sort the input")
+
+    print(f"\nTotal test cases: {len(patterns)}")
+
+    if errors:
+        print(f"\n*** VERIFICATION FAILED ***")
+        print(f"Errors found: {len(errors)}")
+        for error in errors[:10]:
+            print(f"  {error}")
+        if len(errors) > 10:
+            print(f"  ... and {len(errors) - 10} more errors")
+        return False
+    else:
+        print("\n*** ALL TESTS PASSED ***")
+        print("CRC/SORT implementation is correct!")
+        return True
+
+
+def generate_pattern2_golden():
+    """Generate f3/f4 golden data for pattern2_data"""
+    print("\n" + "="*80)
+    print("GENERATING CRC/SORT GOLDEN DATA FOR PATTERN2_DATA")
+    print("="*80)
+
+    patterns = VectorSet.read('00_TESTBED/pattern2_data/pattern2.dat')
+    crc_gen_set(patterns).write('00_TESTBED/pattern2_data/f3.dat')
+    sort_set(patterns).write('00_TESTBED/pattern2_data/f4.dat')
+
+    print(f"\nGenerated {len(patterns)} test cases")
+    print("Output files created:")
+    print("  - 00_TESTBED/pattern2_data/f3.dat (CRC results)")
+    print("  - 00_TESTBED/pattern2_data/f4.dat (SORT results)")
+    print("\n*** GOLDEN DATA GENERATION COMPLETE ***")
+
+
+def main():
+    print("CRC/SORT Simulator")
+    print("="*80)
+
+    if verify_pattern1():
+        generate_pattern2_golden()
+    else:
+        print("\nSkipping pattern2 generation due to verification errors.")
+
+
+if __name__ == "__main__":
+    main()
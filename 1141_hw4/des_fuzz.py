@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+DES Differential Fuzzer
+Cross-checks every DES engine against the reference des_encrypt across a
+process pool, shrinks any mismatch to a minimal case and checks round-trips
+"""
+
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from des_verify_and_generate import des_encrypt, des_encrypt_fast
+
+# Engine name -> function(data, key, decrypt) -> 64-bit result
+# The first entry is the reference every other engine is compared against
+ENGINES = {
+    'reference': des_encrypt,
+    'table': des_encrypt_fast,
+}
+
+MASK64 = (1 << 64) - 1
+
+# Weak and semi-weak DES keys plus their complements and parity variants
+SPECIAL_KEYS = [
+    0x0000000000000000, 0xFFFFFFFFFFFFFFFF,
+    0x0101010101010101, 0xFEFEFEFEFEFEFEFE,
+    0x1F1F1F1F0E0E0E0E, 0xE0E0E0E0F1F1F1F1,
+    0x01FE01FE01FE01FE, 0xFE01FE01FE01FE01,
+    0x1FE01FE00EF10EF1, 0xE01FE01FF10EF10E,
+    0x01E001E001F101F1, 0xE001E001F101F101,
+    0x1FFE1FFE0EFE0EFE, 0xFE1FFE1FFE0EFE0E,
+    0x011F011F010E010E, 0x1F011F010E010E01,
+    0xE0FEE0FEF1FEF1FE, 0xFEE0FEE0FEF1FEF1,
+    0x0123456789ABCDEF, 0x133457799BBCDFF1,
+]
+
+SPECIAL_DATA = [
+    0x0000000000000000, 0xFFFFFFFFFFFFFFFF,
+    0x5555555555555555, 0xAAAAAAAAAAAAAAAA,
+    0x00000000FFFFFFFF, 0xFFFFFFFF00000000,
+    0x0123456789ABCDEF, 0x8000000000000001,
+]
+
+
+def structured_value(rng, specials):
+    """Pick a structured 64-bit value: special, walking bit, byte fill or sparse"""
+    choice = rng.randrange(5)
+    if choice == 0:
+        return rng.choice(specials)
+    if choice == 1:
+        return 1 << rng.randrange(64)
+    if choice == 2:
+        return MASK64 ^ (1 << rng.randrange(64))
+    if choice == 3:
+        return int.from_bytes(bytes([rng.randrange(256)]) * 8, 'big')
+    value = 0
+    for _ in range(rng.randrange(1, 5)):
+        value |= 1 << rng.randrange(64)
+    return value
+
+
+def generate_vectors(seed, count):
+    """Generate (key, data) pairs, half random and half structured"""
+    rng = random.Random(seed)
+    vectors = []
+    for _ in range(count):
+        if rng.random() < 0.5:
+            key = rng.getrandbits(64)
+            data = rng.getrandbits(64)
+        else:
+            key = structured_value(rng, SPECIAL_KEYS)
+            data = structured_value(rng, SPECIAL_DATA)
+        vectors.append((key, data))
+    return vectors
+
+
+def check_vector(key, data, engines=None):
+    """Return a list of (engine, mode, expected, got) mismatches for one vector"""
+    if engines is None:
+        engines = ENGINES
+    names = list(engines)
+    reference = engines[names[0]]
+    failures = []
+
+    for decrypt in (False, True):
+        mode = 'DECRYPT' if decrypt else 'ENCRYPT'
+        expected = reference(data, key, decrypt)
+        for name in names[1:]:
+            got = engines[name](data, key, decrypt)
+            if got != expected:
+                failures.append((name, mode, expected, got))
+
+    return failures
+
+
+def check_round_trip(key, data, engines=None):
+    """Return a list of (engine, mode, expected, got) round-trip failures"""
+    if engines is None:
+        engines = ENGINES
+    failures = []
+
+    for name, fn in engines.items():
+        ciphertext = fn(data, key, False)
+        plaintext = fn(ciphertext, key, True)
+        if plaintext != data:
+            failures.append((name, 'ROUNDTRIP', data, plaintext))
+
+    return failures
+
+
+def fuzz_batch(seed, count, deadline=None):
+    """
+    Worker: run one batch and return (vectors checked, list of failing vectors).
+    Stops early once time.time() passes `deadline`
+    """
+    failing = []
+    checked = 0
+    for key, data in generate_vectors(seed, count):
+        if deadline is not None and time.time() >= deadline:
+            break
+        if check_vector(key, data) or check_round_trip(key, data):
+            failing.append((key, data))
+        checked += 1
+    return checked, failing
+
+
+def is_failing(key, data, engines=None):
+    """True if the vector triggers any mismatch or round-trip failure"""
+    return bool(check_vector(key, data, engines) or check_round_trip(key, data, engines))
+
+
+def shrink(key, data, engines=None):
+    """Greedily clear bits of key and data while the vector keeps failing"""
+    changed = True
+    while changed:
+        changed = False
+        for bit in range(63, -1, -1):
+            mask = 1 << bit
+            if key & mask and is_failing(key & ~mask, data, engines):
+                key &= ~mask
+                changed = True
+            if data & mask and is_failing(key, data & ~mask, engines):
+                data &= ~mask
+                changed = True
+    return key, data
+
+
+def report_failure(key, data, engines=None):
+    """Print a shrunk failing vector in pattern file format"""
+    key, data = shrink(key, data, engines)
+    print(f"\nMinimal failing vector: {key:016X}{data:016X}")
+    print(f"  Key:  {key:016X}")
+    print(f"  Data: {data:016X}")
+    for name, mode, expected, got in check_vector(key, data, engines) + check_round_trip(key, data, engines):
+        print(f"  {name:10s} {mode:9s}: Expected {expected:016X}, Got {got:016X}")
+
+
+def run_fuzz(time_budget=10.0, jobs=None, batch=2000, seed=None):
+    """Run batches across a process pool until the time budget is spent"""
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    if seed is None:
+        seed = random.randrange(1 << 32)
+
+    print("="*80)
+    print("DES DIFFERENTIAL FUZZING")
+    print("="*80)
+    print(f"Engines:     {', '.join(ENGINES)}")
+    print(f"Workers:     {jobs}")
+    print(f"Batch size:  {batch}")
+    print(f"Seed:        {seed}")
+    print(f"Time budget: {time_budget:.1f}s")
+
+    total = 0
+    failing = []
+    next_seed = seed
+    start = time.time()
+    deadline = start + time_budget
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = set()
+        while True:
+            while time.time() < deadline and len(pending) < jobs:
+                pending.add(pool.submit(fuzz_batch, next_seed, batch, deadline))
+                next_seed += 1
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                count, batch_failing = future.result()
+                total += count
+                failing.extend(batch_failing)
+            if failing:
+                for future in pending:
+                    future.cancel()
+                break
+
+    elapsed = time.time() - start
+    rate = total / elapsed if elapsed > 0 else 0.0
+    print(f"\nVectors checked: {total}")
+    print(f"Elapsed:         {elapsed:.2f}s")
+    print(f"Throughput:      {rate:.0f} vectors/sec")
+
+    if failing:
+        print(f"\n*** FUZZING FAILED ***")
+        print(f"Failing vectors found: {len(failing)}")
+        report_failure(*failing[0])
+        return False
+
+    print("\n*** ALL ENGINES AGREE ***")
+    return True
+
+
+def main():
+    time_budget = 10.0
+    jobs = None
+    batch = 2000
+    seed = None
+
+    for arg in sys.argv[1:]:
+        try:
+            if arg.startswith('--time='):
+                time_budget = float(arg.split('=')[1])
+            elif arg.startswith('--jobs='):
+                jobs = int(arg.split('=')[1])
+            elif arg.startswith('--batch='):
+                batch = int(arg.split('=')[1])
+            elif arg.startswith('--seed='):
+                seed = int(arg.split('=')[1])
+        except ValueError:
+            print(f"Ignoring malformed option: {arg}")
+
+    sys.exit(0 if run_fuzz(time_budget, jobs, batch, seed) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,8 @@ DES Encryption/Decryption Simulator
 Verifies correctness with pattern1_data and generates golden data for pattern2_data
 """
 
+from vector_set import VectorSet
+
 # Initial Permutation (IP)
 IP = [
     58, 50, 42, 34, 26, 18, 10, 2,
@@ -283,6 +285,90 @@ def des_decrypt(ciphertext, key, verbose=False):
     return des_encrypt(ciphertext, key, decrypt=True, verbose=verbose)
 
 
+# ========================================
+# Table-driven DES (fast path)
+# ========================================
+
+def build_permute_tables(table, input_bits):
+    """Precompute one 256-entry lookup per input byte for a permutation table"""
+    tables = []
+    for byte_idx in range(input_bits // 8):
+        shift = input_bits - 8 * (byte_idx + 1)
+        tables.append([permute(b << shift, table, input_bits) for b in range(256)])
+    return tables
+
+
+def permute_fast(data, tables, input_bits):
+    """Apply a permutation using tables from build_permute_tables"""
+    result = 0
+    shift = input_bits - 8
+    for t in tables:
+        result |= t[(data >> shift) & 0xFF]
+        shift -= 8
+    return result
+
+
+IP_TABLES = build_permute_tables(IP, 64)
+FP_TABLES = build_permute_tables(FP, 64)
+PC1_TABLES = build_permute_tables(PC1, 64)
+PC2_TABLES = build_permute_tables(PC2, 56)
+E_TABLES = build_permute_tables(E, 32)
+
+# S-box output already routed through the P-box: SP[i][six_bits] -> 32-bit word
+SP_TABLES = [
+    [permute(sbox_lookup(six_bits, i) << (28 - i * 4), P, 32) for six_bits in range(64)]
+    for i in range(8)
+]
+
+_SUBKEY_CACHE = {}
+
+
+def generate_subkeys_fast(key):
+    """Generate (and cache) the 16 encryption subkeys for a key"""
+    subkeys = _SUBKEY_CACHE.get(key)
+    if subkeys is None:
+        key_56 = permute_fast(key, PC1_TABLES, 64)
+        c = key_56 >> 28
+        d = key_56 & 0xFFFFFFF
+        subkeys = []
+        for shift in SHIFT_SCHEDULE:
+            c = left_rotate(c, shift, 28)
+            d = left_rotate(d, shift, 28)
+            subkeys.append(permute_fast((c << 28) | d, PC2_TABLES, 56))
+        subkeys = tuple(subkeys)
+        if len(_SUBKEY_CACHE) >= 4096:
+            _SUBKEY_CACHE.clear()
+        _SUBKEY_CACHE[key] = subkeys
+    return subkeys
+
+
+def des_encrypt_fast(data, key, decrypt=False):
+    """Table-driven DES encryption/decryption, bit-exact with des_encrypt"""
+    subkeys = generate_subkeys_fast(key)
+    if decrypt:
+        subkeys = subkeys[::-1]
+
+    ip_data = permute_fast(data, IP_TABLES, 64)
+    l = ip_data >> 32
+    r = ip_data & 0xFFFFFFFF
+
+    sp0, sp1, sp2, sp3, sp4, sp5, sp6, sp7 = SP_TABLES
+    for subkey in subkeys:
+        x = permute_fast(r, E_TABLES, 32) ^ subkey
+        f_result = (sp0[(x >> 42) & 0x3F] | sp1[(x >> 36) & 0x3F] |
+                    sp2[(x >> 30) & 0x3F] | sp3[(x >> 24) & 0x3F] |
+                    sp4[(x >> 18) & 0x3F] | sp5[(x >> 12) & 0x3F] |
+                    sp6[(x >> 6) & 0x3F] | sp7[x & 0x3F])
+        l, r = r, l ^ f_result
+
+    return permute_fast((r << 32) | l, FP_TABLES, 64)
+
+
+def des_decrypt_fast(ciphertext, key):
+    """Table-driven DES decryption"""
+    return des_encrypt_fast(ciphertext, key, decrypt=True)
+
+
 def verify_pattern1(verbose=False):
     """Verify DES implementation with pattern1_data"""
     print("="*80)
@@ -290,32 +376,23 @@ def verify_pattern1(verbose=False):
     print("="*80)
     
     # Read all pattern files
-    with open('00_TESTBED/pattern1_data/pattern1.dat', 'r') as f:
-        patterns = [line.strip() for line in f.readlines()]
-    
-    with open('00_TESTBED/pattern1_data/f1.dat', 'r') as f:
-        f1_expected = [line.strip() for line in f.readlines()]
-    
-    with open('00_TESTBED/pattern1_data/f2.dat', 'r') as f:
-        f2_expected = [line.strip() for line in f.readlines()]
+    patterns = VectorSet.read('00_TESTBED/pattern1_data/pattern1.dat')
+    f1_expected = VectorSet.read('00_TESTBED/pattern1_data/f1.dat')
+    f2_expected = VectorSet.read('00_TESTBED/pattern1_data/f2.dat')
     
     errors = []
     
-    for i, pattern_line in enumerate(patterns):
-        # Parse input: [127:64] = key, [63:0] = data
-        key_hex = pattern_line[:16]
-        data_hex = pattern_line[16:32]
-        
-        key = int(key_hex, 16)
-        data = int(data_hex, 16)
+    for i, vector in enumerate(patterns):
+        # Input: [127:64] = key, [63:0] = data
+        key, data = vector
         
         if verbose:
             print(f"\n{'#'*80}")
             print(f"TEST CASE {i+1}/{len(patterns)}")
             print(f"{'#'*80}")
-            print(f"Pattern Input: {pattern_line}")
-            print(f"  Key:  {key_hex}")
-            print(f"  Data: {data_hex}")
+            print(f"Pattern Input: {vector.line}")
+            print(f"  Key:  {key:016X}")
+            print(f"  Data: {data:016X}")
         
         # f1.dat: ENCRYPT the data from pattern1.dat
         # pattern1.dat contains plaintext, f1 should contain ciphertext
@@ -326,7 +403,7 @@ def verify_pattern1(verbose=False):
         decrypted = des_decrypt(data, key, verbose=verbose)
         
         # Check f1.dat - [127:64] = key, [63:0] = encrypted data
-        f1_expected_data = int(f1_expected[i][16:32], 16)
+        f1_expected_data = f1_expected.data[i]
         
         if encrypted != f1_expected_data:
             errors.append(f"Line {i+1} f1.dat ENCRYPT: Expected {f1_expected_data:016X}, Got {encrypted:016X}")
@@ -335,7 +412,7 @@ def verify_pattern1(verbose=False):
                 print(f"✓ f1.dat ENCRYPT: Match! Result = {encrypted:016X}")
         
         # Check f2.dat - [127:64] = key, [63:0] = decrypted data
-        f2_expected_data = int(f2_expected[i][16:32], 16)
+        f2_expected_data = f2_expected.data[i]
         
         if decrypted != f2_expected_data:
             errors.append(f"Line {i+1} f2.dat DECRYPT: Expected {f2_expected_data:016X}, Got {decrypted:016X}")
@@ -370,61 +447,53 @@ def generate_pattern2_golden(verbose=False):
     print("="*80)
     
     # Read pattern2.dat
-    with open('00_TESTBED/pattern2_data/pattern2.dat', 'r') as f:
-        patterns = [line.strip() for line in f.readlines()]
+    patterns = VectorSet.read('00_TESTBED/pattern2_data/pattern2.dat')
     
-    f1_data = []  # DES ENCRYPT results
-    f2_data = []  # DES DECRYPT results
+    f1_data = VectorSet.empty(len(patterns))  # DES ENCRYPT results
+    f2_data = VectorSet.empty(len(patterns))  # DES DECRYPT results
     
-    for i, pattern_line in enumerate(patterns):
-        # Parse input: [127:64] = key, [63:0] = data
-        key_hex = pattern_line[:16]
-        data_hex = pattern_line[16:32]
-        
-        key = int(key_hex, 16)
-        data = int(data_hex, 16)
+    for i, vector in enumerate(patterns):
+        # Input: [127:64] = key, [63:0] = data
+        key, data = vector
         
         if verbose:
             print(f"\n{'#'*80}")
             print(f"PATTERN2 TEST CASE {i+1}/{len(patterns)}")
             print(f"{'#'*80}")
-            print(f"Pattern Input: {pattern_line}")
-            print(f"  Key:  {key_hex}")
-            print(f"  Data: {data_hex}")
+            print(f"Pattern Input: {vector.line}")
+            print(f"  Key:  {key:016X}")
+            print(f"  Data: {data:016X}")
         
         # f1: Encrypt the data
         encrypted = des_encrypt(data, key, decrypt=False, verbose=verbose)
-        f1_line = f"{key:016X}{encrypted:016X}"
-        f1_data.append(f1_line)
+        f1_data.key[i] = key
+        f1_data.data[i] = encrypted
         
         if verbose:
-            print(f"Generated f1: {f1_line}")
+            print(f"Generated f1: {f1_data[i].line}")
         
         # f2: Decrypt the data
         decrypted = des_decrypt(data, key, verbose=verbose)
-        f2_line = f"{key:016X}{decrypted:016X}"
-        f2_data.append(f2_line)
+        f2_data.key[i] = key
+        f2_data.data[i] = decrypted
         
         if verbose:
-            print(f"Generated f2: {f2_line}")
+            print(f"Generated f2: {f2_data[i].line}")
         
         # Progress indicator
         if not verbose and (i + 1) % 10 == 0:
             print(f"Generated {i+1}/{len(patterns)} test cases...")
     
     # Write output files
-    with open('00_TESTBED/pattern2_data/f1.dat', 'w') as f:
-        f.write('\n'.join(f1_data) + '\n')
-    
-    with open('00_TESTBED/pattern2_data/f2.dat', 'w') as f:
-        f.write('\n'.join(f2_data) + '\n')
+    f1_data.write('00_TESTBED/pattern2_data/f1.dat')
+    f2_data.write('00_TESTBED/pattern2_data/f2.dat')
     
     print(f"\nGenerated {len(patterns)} test cases")
     print("Output files created:")
     print("  - 00_TESTBED/pattern2_data/f1.dat (DES ENCRYPT results)")
     print("  - 00_TESTBED/pattern2_data/f2.dat (DES DECRYPT results)")
     print("\n*** GOLDEN DATA GENERATION COMPLETE ***")
-    print("\nNote: f3.dat (CRC) and f4.dat (SORT) require separate implementations")
+    print("\nNote: f3.dat (CRC) and f4.dat (SORT) are generated by crc_sort_model.py")
 
 
 def main():
@@ -463,42 +532,33 @@ def main():
 def verify_single_test_case(case_num, verbose=True):
     """Verify a single test case with detailed output"""
     # Read pattern files
-    with open('00_TESTBED/pattern1_data/pattern1.dat', 'r') as f:
-        patterns = [line.strip() for line in f.readlines()]
-    
-    with open('00_TESTBED/pattern1_data/f1.dat', 'r') as f:
-        f1_expected = [line.strip() for line in f.readlines()]
-    
-    with open('00_TESTBED/pattern1_data/f2.dat', 'r') as f:
-        f2_expected = [line.strip() for line in f.readlines()]
+    patterns = VectorSet.read('00_TESTBED/pattern1_data/pattern1.dat')
+    f1_expected = VectorSet.read('00_TESTBED/pattern1_data/f1.dat')
+    f2_expected = VectorSet.read('00_TESTBED/pattern1_data/f2.dat')
     
     if case_num < 1 or case_num > len(patterns):
         print(f"Error: Test case {case_num} out of range (1-{len(patterns)})")
         return
     
     i = case_num - 1
-    pattern_line = patterns[i]
-    
-    # Parse input
-    key_hex = pattern_line[:16]
-    data_hex = pattern_line[16:32]
+    vector = patterns[i]
     
-    key = int(key_hex, 16)
-    data = int(data_hex, 16)
+    # Input: [127:64] = key, [63:0] = data
+    key, data = vector
     
     print(f"\n{'#'*80}")
     print(f"TEST CASE {case_num}")
     print(f"{'#'*80}")
-    print(f"Pattern Input: {pattern_line}")
-    print(f"  Key:  {key_hex}")
-    print(f"  Data: {data_hex}")
+    print(f"Pattern Input: {vector.line}")
+    print(f"  Key:  {key:016X}")
+    print(f"  Data: {data:016X}")
     
     # Encrypt
     print("\n" + ">"*80)
     print("TESTING f1.dat: DES ENCRYPT")
     print(">"*80)
     encrypted = des_encrypt(data, key, decrypt=False, verbose=verbose)
-    f1_expected_data = int(f1_expected[i][16:32], 16)
+    f1_expected_data = f1_expected.data[i]
     
     if encrypted == f1_expected_data:
         print(f"\n✓ f1.dat ENCRYPT: PASS")
@@ -514,7 +574,7 @@ def verify_single_test_case(case_num, verbose=True):
     print("TESTING f2.dat: DES DECRYPT")
     print(">"*80)
     decrypted = des_decrypt(data, key, verbose=verbose)
-    f2_expected_data = int(f2_expected[i][16:32], 16)
+    f2_expected_data = f2_expected.data[i]
     
     if decrypted == f2_expected_data:
         print(f"\n✓ f2.dat DECRYPT: PASS")
@@ -6,13 +6,13 @@ Generate pattern2_data with random 128-bit hexadecimal numbers.
 import random
 import os
 
-def generate_random_128bit_hex():
-    """Generate a random 128-bit number as a 32-character hex string."""
-    # Generate 16 random bytes (128 bits)
-    random_bytes = [random.randint(0, 255) for _ in range(16)]
-    # Convert to hex string (uppercase, no 0x prefix)
-    hex_string = ''.join(f'{byte:02X}' for byte in random_bytes)
-    return hex_string
+from vector_set import VectorSet
+
+def generate_random_vectors(num_patterns):
+    """Generate random 128-bit vectors as a VectorSet."""
+    # 16 random bytes (128 bits) per vector, key bytes first
+    random_bytes = bytes(random.randint(0, 255) for _ in range(16 * num_patterns))
+    return VectorSet.from_bytes(random_bytes)
 
 def generate_pattern2(num_patterns=64, output_dir='00_TESTBED/pattern2_data'):
     """
@@ -28,10 +28,7 @@ def generate_pattern2(num_patterns=64, output_dir='00_TESTBED/pattern2_data'):
     # Generate pattern2.dat
     pattern2_path = os.path.join(output_dir, 'pattern2.dat')
     
-    with open(pattern2_path, 'w') as f:
-        for i in range(num_patterns):
-            hex_data = generate_random_128bit_hex()
-            f.write(f'{hex_data}\n')
+    generate_random_vectors(num_patterns).write(pattern2_path)
     
     print(f'Generated {num_patterns} random 128-bit patterns in {pattern2_path}')
     return pattern2_path
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+IOTDF Design-Space Exploration
+Sweeps alternative microarchitectures (DES rounds per cycle, CRC bytes per
+cycle, sort network depth, input buffer count) over a real pattern stream
+and ranks the configurations by total cycles. Unrolling DES rounds or CRC
+bytes re-times the same functions, so only the sort depth can change results;
+it is checked per configuration, f1-f3 once per stream
+"""
+
+import itertools
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from vector_set import VectorSet
+from des_verify_and_generate import des_encrypt_fast
+from crc_sort_model import SORT_PASSES, crc_gen, sort_bytes, sort_network
+
+# Bytes per vector on iot_in, one per cycle
+LOAD_CYCLES = 16
+DES_ROUNDS = 16
+CRC_BYTES = 16
+SORT_WIDTH = 16
+
+# Core cycles outside the iteration steps, from start_reg to valid:
+#   des_core:  IDLE->COMPUTE, DONE, done_reg -> IOTDF valid_reg
+#   crc_core:  IDLE->COMPUTE, byte_cnt == 16 exit, DONE
+#   sort_core: IDLE->SORT, DONE
+DES_OVERHEAD = 3
+CRC_OVERHEAD = 3
+SORT_OVERHEAD = 2
+
+# Sweep axes
+ROUNDS_PER_CYCLE = (1, 2, 4, 8, 16)
+CRC_BYTES_PER_CYCLE = (1, 2, 4, 8, 16)
+SORT_DEPTHS = tuple(range(8, SORT_PASSES + 1))
+BUFFER_COUNTS = (1, 2, 3, 4)
+
+# Current RTL: des_core, crc_core, sort_core and data_buf0/1
+BASELINE = (1, 1, SORT_PASSES, 2)
+
+FUNCTIONS = ('f1', 'f2', 'f3', 'f4')
+
+
+def ceil_div(a, b):
+    return -(-a // b)
+
+
+def des_latency(rounds_per_cycle):
+    return ceil_div(DES_ROUNDS, rounds_per_cycle) + DES_OVERHEAD
+
+
+def crc_latency(bytes_per_cycle):
+    return ceil_div(CRC_BYTES, bytes_per_cycle) + CRC_OVERHEAD
+
+
+def sort_latency(depth):
+    return depth + SORT_OVERHEAD
+
+
+# ========================================
+# Functional models
+# ========================================
+def sort_truncated(key, data, depth):
+    """sort_core with only `depth` odd-even passes; sort_array[0] is data_in[7:0]"""
+    word = ((key << 64) | data).to_bytes(16, 'big')
+    word = int.from_bytes(bytes(sort_network(word[::-1], depth)), 'big')
+    return word >> 64, word & 0xFFFFFFFFFFFFFFFF
+
+
+@lru_cache(maxsize=None)
+def load_stream(pattern_dir):
+    """Pattern vectors plus the f1..f4 golden sets (reference model where missing)"""
+    name = os.path.basename(pattern_dir).split('_')[0]
+    patterns = VectorSet.read(os.path.join(pattern_dir, f'{name}.dat'))
+    reference = {
+        'f1': lambda key, data: (key, des_encrypt_fast(data, key)),
+        'f2': lambda key, data: (key, des_encrypt_fast(data, key, decrypt=True)),
+        'f3': lambda key, data: (0, crc_gen(key, data)),
+        'f4': sort_bytes,
+    }
+    golden = {}
+    for fn in FUNCTIONS:
+        path = os.path.join(pattern_dir, f'{fn}.dat')
+        if os.path.exists(path):
+            golden[fn] = VectorSet.read(path)
+        else:
+            golden[fn] = VectorSet.from_pairs(reference[fn](key, data) for key, data in patterns)
+    return patterns, golden
+
+
+def stream_errors(pattern_dir):
+    """f1-f3 golden mismatches against the reference DES/CRC models"""
+    patterns, golden = load_stream(pattern_dir)
+    errors = {}
+    for fn in ('f1', 'f2', 'f3'):
+        expected = golden[fn]
+        errors[fn] = 0
+        for i, (key, data) in enumerate(patterns):
+            if fn == 'f1':
+                got = (key, des_encrypt_fast(data, key))
+            elif fn == 'f2':
+                got = (key, des_encrypt_fast(data, key, decrypt=True))
+            else:
+                got = (0, crc_gen(key, data))
+            if got != (expected.key[i], expected.data[i]):
+                errors[fn] += 1
+    return errors
+
+
+@lru_cache(maxsize=None)
+def sort_errors(pattern_dir, depth):
+    """Vectors where a `depth`-pass sort network disagrees with the f4 golden data"""
+    patterns, golden = load_stream(pattern_dir)
+    expected = golden['f4']
+    errors = 0
+    for i, (key, data) in enumerate(patterns):
+        if sort_truncated(key, data, depth) != (expected.key[i], expected.data[i]):
+            errors += 1
+    return errors
+
+
+# ========================================
+# Cycle model
+# ========================================
+def stream_cycles(count, latency, buffers):
+    """
+    Cycles to load and process `count` vectors through `buffers` input
+    buffers and one compute core of fixed `latency`.
+    A buffer is released when its result is valid; loading is 1 byte/cycle
+    """
+    load_end = 0
+    compute_end = 0
+    release = [0] * buffers
+    for i in range(count):
+        load_start = max(load_end, release[i % buffers])
+        load_end = load_start + LOAD_CYCLES
+        compute_end = max(load_end, compute_end) + latency
+        release[i % buffers] = compute_end
+    return compute_end
+
+
+def evaluate_config(pattern_dir, config):
+    """Cycles of every function and sort network errors for one configuration"""
+    rounds, crc_bytes, depth, buffers = config
+    count = len(load_stream(pattern_dir)[0])
+    latency = {
+        'f1': des_latency(rounds),
+        'f2': des_latency(rounds),
+        'f3': crc_latency(crc_bytes),
+        'f4': sort_latency(depth),
+    }
+    cycles = {fn: stream_cycles(count, latency[fn], buffers) for fn in FUNCTIONS}
+    return config, cycles, sort_errors(pattern_dir, depth)
+
+
+def evaluate_batch(pattern_dir, configs):
+    return [evaluate_config(pattern_dir, config) for config in configs]
+
+
+# ========================================
+# Sweep driver
+# ========================================
+def sweep_configs():
+    return list(itertools.product(ROUNDS_PER_CYCLE, CRC_BYTES_PER_CYCLE,
+                                  SORT_DEPTHS, BUFFER_COUNTS))
+
+
+def status(config, errors):
+    """Sort network result: PASS, PASS* (matches this stream only) or FAIL"""
+    if errors:
+        return 'FAIL'
+    if config[2] < SORT_WIDTH:
+        return 'PASS*'
+    return 'PASS'
+
+
+def rank_key(result):
+    """Correct first, then fewest cycles, then the least unrolled hardware"""
+    config, cycles, errors = result
+    rounds, crc_bytes, depth, buffers = config
+    return (status(config, errors) != 'PASS', sum(cycles.values()),
+            rounds + crc_bytes, buffers, depth)
+
+
+def print_table(results, count, top):
+    base_total = None
+    for config, cycles, _ in results:
+        if config == BASELINE:
+            base_total = sum(cycles.values())
+
+    header = (f"{'Rank':>4}  {'R/cyc':>5} {'B/cyc':>5} {'Depth':>5} {'Bufs':>4}  "
+              f"{'f1':>6} {'f2':>6} {'f3':>6} {'f4':>6} {'Total':>7} "
+              f"{'Vec/kcyc':>8} {'Speedup':>7}  Sort")
+    print(header)
+    print("-"*len(header))
+    for rank, (config, cycles, errors) in enumerate(results, 1):
+        if rank > top and config != BASELINE:
+            continue
+        total = sum(cycles.values())
+        rate = 1000.0 * count * len(FUNCTIONS) / total
+        marker = '  <- current RTL' if config == BASELINE else ''
+        print(f"{rank:>4}  {config[0]:>5} {config[1]:>5} {config[2]:>5} {config[3]:>4}  "
+              f"{cycles['f1']:>6} {cycles['f2']:>6} {cycles['f3']:>6} {cycles['f4']:>6} "
+              f"{total:>7} {rate:>8.2f} {base_total / total:>6.2f}x  "
+              f"{status(config, errors)}{marker}")
+
+
+def run_sweep(pattern_dir, jobs=None, top=20):
+    """Evaluate every configuration across a process pool and print the ranking"""
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+
+    configs = sweep_configs()
+    count = len(load_stream(pattern_dir)[0])
+
+    print("="*80)
+    print("IOTDF DESIGN-SPACE EXPLORATION")
+    print("="*80)
+    print(f"Pattern stream:  {pattern_dir} ({count} vectors)")
+    print(f"Configurations:  {len(configs)}")
+    print(f"Workers:         {jobs}")
+    print(f"DES rounds/cyc:  {', '.join(map(str, ROUNDS_PER_CYCLE))}")
+    print(f"CRC bytes/cyc:   {', '.join(map(str, CRC_BYTES_PER_CYCLE))}")
+    print(f"Sort depths:     {SORT_DEPTHS[0]}..{SORT_DEPTHS[-1]}")
+    print(f"Input buffers:   {', '.join(map(str, BUFFER_COUNTS))}")
+
+    start = time.time()
+    # Group by sort depth so each worker reuses its cached sort network check
+    batches = {}
+    for config in configs:
+        batches.setdefault(config[2], []).append(config)
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(evaluate_batch, pattern_dir, batch) for batch in batches.values()]
+        for future in futures:
+            results.extend(future.result())
+    elapsed = time.time() - start
+
+    results.sort(key=rank_key)
+    print(f"\nEvaluated in {elapsed:.2f}s\n")
+    print_table(results, count, top)
+
+    print(f"\nSort: PASS = f4 matches with {SORT_WIDTH}+ passes (sorts any input), "
+          f"PASS* = f4 matches this stream\nwith fewer passes, FAIL = f4 mismatch. "
+          f"R/cyc and B/cyc chain the same DES rounds / CRC byte\nupdates, so they "
+          f"change cycles only and have no per-configuration check.")
+
+    failing = [config for config, _, errors in results if errors]
+    unsafe = [config for config, _, errors in results
+              if status(config, errors) == 'PASS*']
+    print(f"\nSort network failures: {len(failing)} configurations")
+    if failing:
+        depths = sorted({config[2] for config in failing})
+        print(f"  Sort depths failing on this stream: {', '.join(map(str, depths))}")
+    if unsafe:
+        print(f"  PASS*: {len(unsafe)} configurations")
+
+    # f1-f3 are checked once: the golden files against the reference models
+    golden_errors = stream_errors(pattern_dir)
+    golden_errors['f4'] = [r for r in results if r[0] == BASELINE][0][2]
+    print("Golden data check:")
+    for fn, errors in golden_errors.items():
+        if not os.path.exists(os.path.join(pattern_dir, f'{fn}.dat')):
+            print(f"  {fn}: no golden file")
+        else:
+            print(f"  {fn}: {'OK' if errors == 0 else f'{errors} mismatches'}")
+    if any(golden_errors.values()):
+        print("\n*** GOLDEN DATA DOES NOT MATCH THE CURRENT RTL MODELS ***")
+        return False
+    print("\n*** EXPLORATION COMPLETE ***")
+    return True
+
+
+def main():
+    pattern = 1
+    jobs = None
+    top = 20
+
+    for arg in sys.argv[1:]:
+        try:
+            if arg.startswith('--pattern='):
+                pattern = int(arg.split('=')[1])
+            elif arg.startswith('--jobs='):
+                jobs = int(arg.split('=')[1])
+            elif arg.startswith('--top='):
+                top = int(arg.split('=')[1])
+        except ValueError:
+            print(f"Ignoring malformed option: {arg}")
+
+    pattern_dir = f'00_TESTBED/pattern{pattern}_data'
+    sys.exit(0 if run_sweep(pattern_dir, jobs, top) else 1)
+
+
+if __name__ == "__main__":
+    main()
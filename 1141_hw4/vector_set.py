@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Compact 128-bit Vector Container
+Pattern/result vectors stored as interleaved uint64 words (16 bytes per vector)
+with zero-copy key ([127:64]) and data ([63:0]) column views
+"""
+
+import re
+import sys
+from array import array
+
+# Size hint in characters for each readlines() block when loading pattern files
+READ_BLOCK = 1 << 22
+
+
+# One pattern line: exactly 32 hex digits, nothing else
+VECTOR_LINE = re.compile(r'[0-9A-Fa-f]{32}')
+
+
+class VectorRecord:
+    """One vector of a VectorSet; unpacks as (key, data)"""
+    __slots__ = ('vectors', 'index')
+
+    def __init__(self, vectors, index):
+        self.vectors = vectors
+        self.index = index
+
+    @property
+    def key(self):
+        return self.vectors.key[self.index]
+
+    @key.setter
+    def key(self, value):
+        self.vectors.key[self.index] = value
+
+    @property
+    def data(self):
+        return self.vectors.data[self.index]
+
+    @data.setter
+    def data(self, value):
+        self.vectors.data[self.index] = value
+
+    @property
+    def line(self):
+        """Pattern file line: 32 hex characters, key then data"""
+        return f"{self.key:016X}{self.data:016X}"
+
+    def __iter__(self):
+        yield self.key
+        yield self.data
+
+    def __repr__(self):
+        return f"VectorRecord({self.line})"
+
+
+class VectorSet:
+    """
+    Sequence of 128-bit vectors backed by one array('Q').
+    key and data are memoryview columns; slicing and chunking return views
+    """
+    __slots__ = ('key', 'data')
+
+    def __init__(self, key=None, data=None):
+        if key is None:
+            words = memoryview(array('Q'))
+            key, data = words[0::2], words[1::2]
+        self.key = key
+        self.data = data
+
+    @classmethod
+    def from_words(cls, words):
+        """Wrap interleaved [key0, data0, key1, data1, ...] words without copying"""
+        words = memoryview(words)
+        return cls(words[0::2], words[1::2])
+
+    @classmethod
+    def empty(cls, count):
+        """Zero-filled set of `count` vectors"""
+        return cls.from_words(array('Q', [0]) * (2 * count))
+
+    @classmethod
+    def from_pairs(cls, pairs):
+        """Build from an iterable of (key, data) integers"""
+        words = array('Q')
+        for key, data in pairs:
+            words.append(key)
+            words.append(data)
+        return cls.from_words(words)
+
+    @classmethod
+    def from_bytes(cls, buf):
+        """Build from big-endian bytes, 16 per vector (key first)"""
+        if len(buf) % 16:
+            raise ValueError(f"Expected a multiple of 16 bytes, got {len(buf)}")
+        words = array('Q')
+        words.frombytes(buf)
+        if sys.byteorder == 'little':
+            words.byteswap()
+        return cls.from_words(words)
+
+    @classmethod
+    def read(cls, path):
+        """Read a pattern file of 32-hex-character lines"""
+        words = array('Q')
+        first_line = 1
+        with open(path, 'r') as f:
+            while True:
+                block = f.readlines(READ_BLOCK)
+                if not block:
+                    break
+                lines = [line.strip() for line in block]
+                lines = [line for line in lines if line]
+                # fromhex() ignores line boundaries and whitespace, so every line is
+                # validated before the block is joined
+                bad = [line for line in lines if not VECTOR_LINE.fullmatch(line)]
+                if bad:
+                    offset = next(i for i, line in enumerate(block, first_line)
+                                  if line.strip() == bad[0])
+                    raise ValueError(f"{path}:{offset}: expected 32 hex characters, got {bad[0]!r}")
+                buf = bytes.fromhex(''.join(lines))
+                words.frombytes(buf)
+                first_line += len(block)
+        if sys.byteorder == 'little':
+            words.byteswap()
+        return cls.from_words(words)
+
+    def write(self, path, chunk_size=1 << 16):
+        """Write as 32-hex-character lines"""
+        with open(path, 'w') as f:
+            for chunk in self.chunks(chunk_size):
+                text = chunk.to_bytes().hex().upper()
+                f.write('\n'.join(text[i:i + 32] for i in range(0, len(text), 32)) + '\n')
+
+    def to_bytes(self):
+        """Big-endian bytes, 16 per vector (key first)"""
+        words = array('Q', [0]) * (2 * len(self))
+        view = memoryview(words)
+        view[0::2] = self.key
+        view[1::2] = self.data
+        if sys.byteorder == 'little':
+            words.byteswap()
+        return words.tobytes()
+
+    def chunks(self, size):
+        """Yield consecutive views of at most `size` vectors"""
+        for start in range(0, len(self), size):
+            yield self[start:start + size]
+
+    def lines(self):
+        """Yield pattern file lines"""
+        for key, data in zip(self.key, self.data):
+            yield f"{key:016X}{data:016X}"
+
+    def __len__(self):
+        return len(self.key)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return VectorSet(self.key[index], self.data[index])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("vector index out of range")
+        return VectorRecord(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield VectorRecord(self, index)
+
+    def __repr__(self):
+        return f"VectorSet({len(self)} vectors)"